@@ -1,42 +1,155 @@
+import atexit
+import contextlib
+import itertools
 import sqlite3
 from tabulate import tabulate
 from pathlib import Path
 
+# apsw binds the SQLite C API much more thinly than the stdlib module, which shaves
+# per-call overhead off the tiny statements this class runs. It is strictly optional;
+# without it the stdlib backend is used and behaviour is identical.
+try:
+    import apsw
+except ImportError:
+    apsw = None
+
+# SQLite caps the number of "?" placeholders per statement (SQLITE_MAX_VARIABLE_NUMBER,
+# 999 by default). Multi-row inserts must stay under this limit.
+MAX_SQL_VARIABLES = 999
+
+# The hot statements live here as module constants so every call passes the exact same
+# (interned) SQL text and hits the connection's compiled-statement cache instead of
+# re-running the parser.
+_SQL_INSERT_QUESTIONS_PREFIX = "INSERT INTO questions (question) VALUES "
+_SQL_INSERT_ANSWERS_PREFIX = "INSERT INTO answers (question_id, answer_a, answer_b, answer_c, answer_d) VALUES "
+_SQL_DELETE_QUESTION = "DELETE FROM questions WHERE id=(?)"
+_SQL_DELETE_ANSWERS_BY_QUESTION = "DELETE FROM answers WHERE question_id=(?)"
+_SQL_DELETE_ANSWER = "DELETE FROM answers WHERE id=(?) RETURNING question_id"
+_SQL_UPDATE_QUESTION = "UPDATE questions SET question = ? WHERE id = ?"
+# COALESCE keeps a column unchanged when its parameter is None, so one statement covers
+# every combination of provided columns instead of one UPDATE per column.
+_SQL_UPDATE_ANSWERS_BY_ID = ("UPDATE answers SET answer_a=COALESCE(?, answer_a), answer_b=COALESCE(?, answer_b), "
+                             "answer_c=COALESCE(?, answer_c), answer_d=COALESCE(?, answer_d), "
+                             "question_id=COALESCE(?, question_id) WHERE id = ?")
+_SQL_UPDATE_ANSWERS_BY_QUESTION_ID = ("UPDATE answers SET answer_a=COALESCE(?, answer_a), "
+                                      "answer_b=COALESCE(?, answer_b), answer_c=COALESCE(?, answer_c), "
+                                      "answer_d=COALESCE(?, answer_d) WHERE question_id = ?")
+_SQL_SELECT_QUESTION = "SELECT question FROM questions WHERE id=?"
+_SQL_SELECT_ANSWERS = "SELECT answer_a, answer_b, answer_c, answer_d FROM answers WHERE question_id=?"
+
+# Methods that take a table name dispatch through these dicts: the name is validated
+# against the whitelist and each table maps to one fixed SQL text, so user input never
+# reaches the SQL and the statement cache always hits.
+_ALLOWED_TABLES = frozenset({"questions", "answers"})
+
+_SQL_CREATE_QUESTIONS = """CREATE TABLE IF NOT EXISTS questions(
+                                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                question TEXT)"""
+_SQL_CREATE_ANSWERS = """CREATE TABLE IF NOT EXISTS answers(
+                                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                question_id INTEGER UNIQUE NOT NULL,
+                                answer_a TEXT NOT NULL,
+                                answer_b TEXT NOT NULL,
+                                answer_c TEXT NOT NULL,
+                                answer_d TEXT NOT NULL,
+                                FOREIGN KEY (question_id) REFERENCES questions(id) ON DELETE CASCADE)"""
+# Covering index: a lookup by question_id that only needs the four answer columns is
+# satisfied from the index alone, without touching the table's B-tree leaves.
+_SQL_CREATE_ANSWERS_INDEX = """CREATE UNIQUE INDEX IF NOT EXISTS idx_answers_qid
+                                ON answers(question_id, answer_a, answer_b, answer_c, answer_d)"""
+
+# The whole schema as one script: a single parse/execute pass in one transaction instead
+# of a Python round-trip per DDL statement.
+_SCHEMA_SQL = ";\n".join(
+    ["BEGIN", _SQL_CREATE_QUESTIONS, _SQL_CREATE_ANSWERS, _SQL_CREATE_ANSWERS_INDEX, "ANALYZE", "COMMIT"]
+) + ";"
+_SQL_SELECT_ALL = {table: f"SELECT * FROM {table}" for table in _ALLOWED_TABLES}
+_SQL_TABLE_INFO = {table: f"PRAGMA table_info({table})" for table in _ALLOWED_TABLES}
+_SQL_DELETE_ALL = {table: f"DELETE FROM {table}" for table in _ALLOWED_TABLES}
+
+# apsw only exposes cursor.description while a statement has pending rows; an empty
+# SELECT completes inside execute() and reading the description raises this error.
+# The stdlib backend never raises, hence the empty tuple.
+_DESCRIPTION_UNAVAILABLE = (apsw.ExecutionCompleteError,) if apsw is not None else ()
+
 
 class DatabaseCreator:
     """
     A class for creating and managing SQLite3 database for a quiz application.
     """
+    _wal_enabled_paths = set()
+    _schema_ready = {}
+
     def __init__(self, path: Path):
         """
         Initialize the DatabaseCreator object.
 
-        Creates a connection to the database and create the required tables.
+        Opens a single connection to the database, creates the required tables and keeps
+        the connection alive for the lifetime of the object. Reopening on every "with"
+        block would discard the per-connection page cache each time; a long-lived
+        connection keeps it warm across operations. The connection is closed by an
+        explicit "close()" call or automatically at interpreter exit.
         """
         self.path = path
         self.conn = None
         self.cursor = None
+        self._in_tx = False
 
+        self.initialize_database_connection_and_cursor()
         self.create_tables_if_not_exist()
+        atexit.register(self.close)
 
     def __enter__(self) -> "DatabaseCreator":
         """
-        Enter the context and initialize the database connection and cursor.
+        Enter the context. The connection is already open, so this is a no-op.
         """
-        self.initialize_database_connection_and_cursor()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """
-        Close connection to the database.
+        Leave the context. The connection stays open so the page cache survives
+        subsequent "with" blocks; call "close()" to release it.
+        """
+
+    def close(self) -> None:
+        """
+        Close the connection to the database. Safe to call more than once.
         """
-        self.disconnect_from_database()
+        if self.conn is not None:
+            self.disconnect_from_database()
 
     def initialize_database_connection(self) -> None:
         """
-        Initialize a connection to the database.
+        Initialize a connection to the database and apply performance PRAGMAs.
+        """
+        if apsw is not None:
+            self.conn = apsw.Connection(str(self.path), statementcachesize=256)
+        else:
+            self.conn = sqlite3.connect(self.path, cached_statements=256)
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.apply_performance_pragmas()
+
+    def apply_performance_pragmas(self) -> None:
+        """
+        Tune the connection for faster commits.
+
+        WAL mode with "synchronous=NORMAL" turns every commit into a single append to the
+        "-wal" file instead of two fsyncs, and lets readers proceed while a write is in
+        progress. WAL is written into the database header, so it is enabled only once per
+        path; the remaining PRAGMAs are per-connection and applied every time.
+        In-memory databases are skipped as journaling does not apply to them.
         """
-        self.conn = sqlite3.connect(self.path)
+        if str(self.path) == ":memory:":
+            return
+
+        if self.path not in self._wal_enabled_paths:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self._wal_enabled_paths.add(self.path)
+
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-64000")
+        self.conn.execute("PRAGMA busy_timeout=5000")
 
     def initialize_cursor(self) -> None:
         """
@@ -53,8 +166,10 @@ class DatabaseCreator:
 
     def disconnect_from_database(self) -> None:
         """
-        Close connection to the database.
+        Close connection to the database. "PRAGMA optimize" refreshes the planner
+        statistics for the next process if the data changed enough to matter.
         """
+        self.conn.execute("PRAGMA optimize")
         self.cursor.close()
         self.conn.close()
         self.cursor = None
@@ -62,27 +177,87 @@ class DatabaseCreator:
 
     def execute_operation(self) -> None:
         """
-        Commit changes to the database.
+        Commit changes to the database. Inside a "transaction()" block this is a no-op;
+        the block commits once on exit instead of once per mutation.
+
+        Issued as SQL rather than through a commit() method because apsw connections are
+        plain autocommit and have no DB-API transaction layer; the in_transaction guard
+        covers statements apsw already committed on its own.
         """
-        self.conn.commit()
+        if not self._in_tx and self.conn.in_transaction:
+            self.conn.execute("COMMIT")
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Group several mutations under a single transaction and one commit.
+
+        Without this, every add/remove/update call commits (and fsyncs) on its own.
+        "BEGIN IMMEDIATE" takes the write lock up front so the block cannot fail with a
+        busy error halfway through. On an exception the whole block rolls back. Nested
+        use simply joins the outer transaction.
+
+        Usage:
+        with DatabaseCreator(Path("database_path")) as db:
+            with db.transaction():
+                db.add_data_to_questions_table("What is Azure?")
+                db.add_data_to_answers_table(1, ["cloud", "music player", "color", "food"])
+        """
+        if self._in_tx:
+            yield
+            return
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        self._in_tx = True
+        try:
+            yield
+            # The COMMIT sits inside the try so that its own failure also rolls back;
+            # otherwise the transaction would stay open while _in_tx says it is closed,
+            # and the next mutation would silently commit the half-finished block.
+            self.conn.execute("COMMIT")
+        except BaseException:
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK")
+            raise
+        finally:
+            self._in_tx = False
 
     def create_tables_if_not_exist(self) -> None:
         """
         Create required tables if they do not exist.
+
+        The DDL runs once per path per process; later instantiations skip the
+        parse/schema check entirely. Each ":memory:" connection is a brand-new database,
+        so those are never cached. If the schema is dropped out of band, call
+        "invalidate_schema_cache()" to force the DDL to run again.
         """
-        with self:
-            self.create_questions_table()
-            self.create_answers_table()
-            self.execute_operation()
+        cacheable = str(self.path) != ":memory:"
+        if cacheable and self._schema_ready.get(self.path):
+            return
+
+        # The script carries its own BEGIN/COMMIT and ends with ANALYZE so the planner
+        # has index statistics from the start; apsw runs multi-statement SQL directly.
+        if apsw is not None:
+            self.conn.execute(_SCHEMA_SQL)
+        else:
+            self.conn.executescript(_SCHEMA_SQL)
+
+        if cacheable:
+            self._schema_ready[self.path] = True
+
+    def invalidate_schema_cache(self) -> None:
+        """
+        Forget that this path's schema was created, so the next
+        "create_tables_if_not_exist" runs the DDL again.
+        """
+        self._schema_ready.pop(self.path, None)
 
     def create_questions_table(self) -> None:
         """
         Create "questions" table in database if it does not exit.
         The table contains columns "id" (primary key) and "question".
         """
-        self.cursor.execute("""CREATE TABLE IF NOT EXISTS questions(
-                                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                                question TEXT)""")
+        self.cursor.execute(_SQL_CREATE_QUESTIONS)
 
     def create_answers_table(self) -> None:
         """
@@ -90,14 +265,8 @@ class DatabaseCreator:
         The table contains columns "id" (primary key), question_id (foreign key) related to the "questions" table,
         "answer_a" (correct answer), "answer_b", "answer_c" and "answer_d".
         """
-        self.cursor.execute("""CREATE TABLE IF NOT EXISTS answers(
-                                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                                question_id INTEGER UNIQUE NOT NULL,
-                                answer_a TEXT NOT NULL,
-                                answer_b TEXT NOT NULL,
-                                answer_c TEXT NOT NULL,
-                                answer_d TEXT NOT NULL,
-                                FOREIGN KEY (question_id) REFERENCES questions(id))""")
+        self.cursor.execute(_SQL_CREATE_ANSWERS)
+        self.cursor.execute(_SQL_CREATE_ANSWERS_INDEX)
 
     @staticmethod
     def confirm_user_action(message: str) -> bool:
@@ -122,8 +291,21 @@ class DatabaseCreator:
             db.add_data_to_question_table("What is Azure?")
         """
 
-        self.cursor.execute("INSERT INTO questions (question) VALUES (?)", (question_text.strip(),))
-        self.execute_operation()
+        self.add_questions_bulk([question_text])
+
+    def add_questions_bulk(self, question_texts: list) -> None:
+        """
+        Add many questions to the "questions" table in a single transaction.
+
+        A lone commit per row forces one fsync per question; batching the whole list into
+        one transaction pays the commit cost only once.
+
+        Usage:
+        with DatabaseCreator(Path("database_path")) as db:
+            db.add_questions_bulk(["What is Azure?", "What is AWS?"])
+        """
+        rows = [(question.strip(),) for question in question_texts]
+        self.insert_rows_in_chunks(_SQL_INSERT_QUESTIONS_PREFIX, 1, rows)
 
     def add_data_to_answers_table(self, question_id: int, answers: list) -> None:
         """
@@ -134,35 +316,64 @@ class DatabaseCreator:
             db.add_data_to_answers_table(1, ["cloud", "music player", "color", "food"]
 
         """
-        if not isinstance(answers, list):
-            raise ValueError("Answers must be provided as a list.")
+        # One combined check, gated by __debug__ so "python -O" strips it entirely.
+        # "type(...) is" skips the MRO walk isinstance pays on every element.
+        if __debug__:
+            if type(answers) is not list or len(answers) != 4 or not all(type(answer) is str for answer in answers):
+                raise ValueError(f"Answers must be a list of exactly 4 strings "
+                                 f"(answer_a, answer_b, answer_c, answer_d). Received: {answers}")
 
-        if len(answers) != 4:
-            raise ValueError("Exactly 4 answers are required (answer_a, answer_b, answer_c, answer_d).")
+        self.add_answers_bulk([(question_id, answers[0], answers[1], answers[2], answers[3])])
 
-        for i, answer in enumerate(answers):
-            if not isinstance(answer, str):
-                raise ValueError(f"Answer {1+i} is not a string: {answer}")
+    def add_answers_bulk(self, rows: list) -> None:
+        """
+        Add many answer rows to the "answers" table in a single transaction.
 
-        self.cursor.execute("INSERT INTO answers (question_id, answer_a, answer_b, answer_c, answer_d)"
-                            " VALUES (?, ?, ?, ?, ?)", (question_id, (answers[0].strip()),
-                                                        (answers[1]).strip(), (answers[2]).strip(),
-                                                        (answers[3]).strip()))
+        Each row is a tuple (question_id, answer_a, answer_b, answer_c, answer_d).
+        Batching all rows into one transaction replaces one fsync per row with a single
+        commit at the end.
 
+        Usage:
+        with DatabaseCreator(Path("database_path")) as db:
+            db.add_answers_bulk([(1, "cloud", "music player", "color", "food")])
+        """
+        rows = [(question_id, answer_a.strip(), answer_b.strip(), answer_c.strip(), answer_d.strip())
+                for question_id, answer_a, answer_b, answer_c, answer_d in rows]
+        self.insert_rows_in_chunks(_SQL_INSERT_ANSWERS_PREFIX, 5, rows)
+
+    def insert_rows_in_chunks(self, insert_prefix: str, columns: int, rows: list) -> None:
+        """
+        Insert rows as multi-row "VALUES (...),(...)" statements inside one transaction.
+
+        executemany still binds and steps the virtual machine once per row; packing as many
+        rows as the placeholder limit allows into each statement cuts that dispatch
+        overhead further. All chunks share a single commit.
+        """
+        if not rows:
+            return
+
+        rows_per_statement = MAX_SQL_VARIABLES // columns
+        row_placeholder = "(" + ", ".join("?" * columns) + ")"
+
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+        for start in range(0, len(rows), rows_per_statement):
+            chunk = rows[start:start + rows_per_statement]
+            sql = insert_prefix + ", ".join([row_placeholder] * len(chunk))
+            self.cursor.execute(sql, list(itertools.chain.from_iterable(chunk)))
         self.execute_operation()
 
-    def remove_rows_from_questions_table(self, question_id: int, answer_removed=False) -> None:
+    def remove_rows_from_questions_table(self, question_id: int) -> None:
         """
         Remove question form "questions" table based on "question_id" as long with corresponding answers.
+        The answers are removed by the "ON DELETE CASCADE" foreign key, so a single DELETE
+        covers both tables.
 
         Usage:
         with DatabaseCreator(Path("database_path")) as db:
             db.remove_rows_from_questions_table(5)
         """
-        self.cursor.execute("DELETE FROM questions WHERE id=(?)", (question_id,))
-        if not answer_removed:
-            self.cursor.execute("DELETE FROM answers WHERE question_id=(?)", (question_id,))
-
+        self.cursor.execute(_SQL_DELETE_QUESTION, (question_id,))
         self.execute_operation()
 
     def remove_rows_from_answers_table(self, answer_id: int = None, question_id: int = None,
@@ -178,19 +389,23 @@ class DatabaseCreator:
             # remove an answer based on "question_id"
             db.remove_rows_from_answer_table(question_id=5)
         """
-        if question_id:
-            self.cursor.execute("DELETE FROM answers WHERE question_id=(?)", (question_id,))
-
-        if answer_id:
-            if not question_removed:
-                self.cursor.execute("SELECT question_id FROM answers WHERE id=(?)", (answer_id,))
-                question_id = self.cursor.fetchone()[0]
-            self.cursor.execute("DELETE FROM answers WHERE id=(?)", (answer_id,))
-
-        self.execute_operation()
+        # The explicit transaction keeps both deletes atomic on either backend; apsw
+        # would otherwise autocommit each statement on its own.
+        with self.transaction():
+            if question_id:
+                self.cursor.execute(_SQL_DELETE_ANSWERS_BY_QUESTION, (question_id,))
+
+            if answer_id:
+                # "RETURNING question_id" hands back the parent id in the same statement,
+                # saving the extra SELECT round-trip. fetchall() rather than fetchone():
+                # apsw keeps the statement "in progress" until it is stepped to
+                # completion, and the pending DELETE would make the commit fail.
+                rows = self.cursor.execute(_SQL_DELETE_ANSWER, (answer_id,)).fetchall()
+                if not question_removed:
+                    question_id = rows[0][0] if rows else None
 
         if not question_removed and self.confirm_user_action("Would you like remove corresponding question? Yes/No:"):
-            self.remove_rows_from_questions_table(question_id, answer_removed=True)
+            self.remove_rows_from_questions_table(question_id)
 
     def update_questions_table(self, question_id: int, question: str) -> None:
         """
@@ -200,9 +415,7 @@ class DatabaseCreator:
         with DatabaseCreator(Path("database_path")) as db:
             db.update_questions_table(1, "2+2=?")
         """
-        self.cursor.execute(f"UPDATE questions "
-                            "SET question = ? "
-                            "WHERE id = ?", (question, question_id))
+        self.cursor.execute(_SQL_UPDATE_QUESTION, (question, question_id))
 
         self.execute_operation()
 
@@ -223,50 +436,33 @@ class DatabaseCreator:
             raise ValueError(f"query_parameter must be 'id' or 'question_id'. If you like update answers tabel based "
                              "on answer id you can omit this parameter. Received: {query_parameter}")
 
-        update_values = []
-        if answer_a is not None:
-            update_values.append(("answer_a", answer_a))
-        if answer_b is not None:
-            update_values.append(("answer_b", answer_b))
-        if answer_c is not None:
-            update_values.append(('answer_c', answer_c))
-        if answer_d is not None:
-            update_values.append(('answer_d', answer_d))
-
         if query_parameter == "id":
-            if not update_values and question_id is None:
+            if all(value is None for value in (answer_a, answer_b, answer_c, answer_d, question_id)):
                 raise ValueError("At least one field should be updated")
-            if question_id is not None:
-                update_values.insert(0, ("question_id", question_id))
-
-            for column, new_value in update_values:
-                self.cursor.execute(f"UPDATE answers "
-                                    f"SET {column} = ?"
-                                    f"WHERE id = ?", (new_value, answer_id))
+            self.cursor.execute(_SQL_UPDATE_ANSWERS_BY_ID,
+                                (answer_a, answer_b, answer_c, answer_d, question_id, answer_id))
         else:
             if answer_id is not None:
                 raise ValueError("Cannot update answer id (primary key).")
-            for column, new_value in update_values:
-                self.cursor.execute(f"UPDATE answers "
-                                    f"SET {column} = ?"
-                                    f"WHERE question_id = ?", (new_value, question_id))
+            self.cursor.execute(_SQL_UPDATE_ANSWERS_BY_QUESTION_ID,
+                                (answer_a, answer_b, answer_c, answer_d, question_id))
 
         self.execute_operation()
 
     def get_question(self, question_id: int) -> str:
         """
-        Retrieve question from questions table.
+        Retrieve question from questions table. Returns None if the question does not exist.
         """
-        self.cursor.execute("SELECT question FROM questions WHERE id=?", (question_id,))
+        self.cursor.execute(_SQL_SELECT_QUESTION, (question_id,))
         question = self.cursor.fetchone()
-        return question[0]
+        return question[0] if question is not None else None
 
     def get_answers(self, question_id: int) -> tuple:
         """
         Retrieve answers from answers table based on question_id.
+        Returns None if the question has no answers.
         """
-        self.cursor.execute("SELECT answer_a, answer_b, answer_c, answer_d FROM answers WHERE question_id=?",
-                            (question_id,))
+        self.cursor.execute(_SQL_SELECT_ANSWERS, (question_id,))
         answers = self.cursor.fetchone()
         return answers
 
@@ -278,13 +474,20 @@ class DatabaseCreator:
         with DatabaseCreator(Path("database_path")) as db:
             db.display_table_content("questions")
         """
-        self.cursor.execute(f"PRAGMA table_info({table_name})")
-        column_names = [column[1] for column in self.cursor.fetchall()]
+        if table_name not in _ALLOWED_TABLES:
+            raise ValueError(f"Unknown table: {table_name}. Expected 'questions' or 'answers'.")
 
-        self.cursor.execute(f"SELECT * FROM {table_name}")
-        rows = self.cursor.fetchall()
+        # cursor.description supplies the column names of the SELECT itself, saving the
+        # separate PRAGMA table_info round-trip, and tabulate consumes the cursor row by
+        # row instead of a fetchall() list of the whole table. When the table is empty
+        # apsw has no description to give, so fall back to PRAGMA table_info.
+        self.cursor.execute(_SQL_SELECT_ALL[table_name])
+        try:
+            column_names = [column[0] for column in self.cursor.description]
+        except _DESCRIPTION_UNAVAILABLE:
+            column_names = [column[1] for column in self.conn.execute(_SQL_TABLE_INFO[table_name])]
 
-        table = tabulate(rows, headers=column_names, tablefmt="pretty")
+        table = tabulate(self.cursor, headers=column_names, tablefmt="pretty")
         return table
 
     def clear_table(self, table_name: str) -> None:
@@ -297,10 +500,13 @@ class DatabaseCreator:
 
         :param table_name: "questions" or "answers"
         """
-        self.cursor.execute(f"DROP TABLE {table_name}")
+        if table_name not in _ALLOWED_TABLES:
+            raise ValueError(f"Unknown table: {table_name}. Expected 'questions' or 'answers'.")
 
-        if table_name == "questions":
-            self.create_questions_table()
-        elif table_name == "answers":
-            self.create_answers_table()
-        self.execute_operation()
+        # An unqualified DELETE triggers SQLite's truncate optimization, which drops the
+        # table's pages wholesale instead of deleting row by row. Dropping and recreating
+        # the table would force a schema-change round-trip for the same result. The
+        # transaction keeps the delete and the AUTOINCREMENT reset atomic on both backends.
+        with self.transaction():
+            self.cursor.execute(_SQL_DELETE_ALL[table_name])
+            self.cursor.execute("DELETE FROM sqlite_sequence WHERE name=?", (table_name,))
@@ -1,19 +1,43 @@
 import pytest
 from pathlib import Path
+import main
 from main import DatabaseCreator
 
-path = Path("test.db")
+# An in-memory database lives as long as the session-scoped connection, so the suite
+# never touches the filesystem or pays an fsync.
+path = Path(":memory:")
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def setup_database():
     with DatabaseCreator(path) as db:
         yield db
+        db.close()
 
 
 @pytest.fixture()
-def setup_teardown_database():
-    with DatabaseCreator(path) as db:
-        yield db
-        db.clear_table("questions")
-        db.clear_table("answers")
+def setup_teardown_database(setup_database):
+    yield setup_database
+    setup_database.clear_table("questions")
+    setup_database.clear_table("answers")
+
+
+@pytest.fixture(scope="session")
+def hot_plans():
+    """
+    The hot statements with dummy parameters and the query-plan fragment each one must
+    keep: "USING INTEGER PRIMARY KEY" for rowid lookups, "USING INDEX" for the
+    question_id lookups. A statement whose plan degrades to a scan fails the assertion.
+    """
+    return {
+        "select_question": (main._SQL_SELECT_QUESTION, (1,), "USING INTEGER PRIMARY KEY"),
+        "select_answers": (main._SQL_SELECT_ANSWERS, (1,), "USING INDEX"),
+        "delete_question": (main._SQL_DELETE_QUESTION, (1,), "USING INTEGER PRIMARY KEY"),
+        "delete_answers_by_question": (main._SQL_DELETE_ANSWERS_BY_QUESTION, (1,), "USING INDEX"),
+        "delete_answer": (main._SQL_DELETE_ANSWER, (1,), "USING INTEGER PRIMARY KEY"),
+        "update_question": (main._SQL_UPDATE_QUESTION, ("q", 1), "USING INTEGER PRIMARY KEY"),
+        "update_answers_by_id": (main._SQL_UPDATE_ANSWERS_BY_ID, ("a", "b", "c", "d", 1, 1),
+                                 "USING INTEGER PRIMARY KEY"),
+        "update_answers_by_question_id": (main._SQL_UPDATE_ANSWERS_BY_QUESTION_ID, ("a", "b", "c", "d", 1),
+                                          "USING INDEX"),
+    }
@@ -1,4 +1,5 @@
 import pytest
+import main
 from main import DatabaseCreator
 from pathlib import Path
 
@@ -18,12 +19,15 @@ def test_context_manager() -> None:
     Test if context manager works as intended.
     """
     try:
-        with DatabaseCreator(Path("test.db")) as db:
+        with DatabaseCreator(Path(":memory:")) as db:
             assert db.cursor is not None, "Cursor does not exist."
             assert db.conn is not None, "Connection to database did not open."
     except Exception as e:
         raise AssertionError(f"Error occurred inside with block{e}")
     else:
+        assert db.cursor is not None, "Cursor should stay alive after the with block."
+        assert db.conn is not None, "Connection should stay open after the with block."
+        db.close()
         assert db.cursor is None, "Cursor still active."
         assert db.conn is None, "Connection still open."
 
@@ -52,6 +56,27 @@ def test_table_schema(setup_database: DatabaseCreator, table_name: str, table_co
         raise AssertionError(e)
 
 
+@pytest.mark.parametrize("backend", ["default", "stdlib"])
+def test_remove_answer_by_id(monkeypatch, backend: str) -> None:
+    """
+    Test if 'remove_rows_from_answers_table' deletes by answer_id on both backends.
+    Regression test: the DELETE ... RETURNING statement used to stay "in progress"
+    under apsw and made the commit fail.
+    """
+    if backend == "stdlib":
+        monkeypatch.setattr(main, "apsw", None)
+
+    db = DatabaseCreator(Path(":memory:"))
+    db.add_data_to_questions_table(questions[0])
+    db.add_data_to_answers_table(1, answers[0])
+    db.remove_rows_from_answers_table(answer_id=1, question_removed=True)
+
+    db.cursor.execute("SELECT * FROM answers")
+    assert db.cursor.fetchall() == [], "Answer was not removed."
+    assert not db.conn.in_transaction, "Transaction left open after the delete."
+    db.close()
+
+
 @pytest.mark.parametrize("table_name", expected_columns)
 def test_table_clearing(setup_database: DatabaseCreator, table_name: str) -> None:
     """
@@ -62,7 +87,10 @@ def test_table_clearing(setup_database: DatabaseCreator, table_name: str) -> Non
         setup_database.cursor.execute(f"INSERT INTO {table_name} (question) VALUES (?)", (value,))
         setup_database.execute_operation()
     if table_name == "answers":
-        val = [questions_id[1]] + answers[0]
+        setup_database.cursor.execute("INSERT INTO questions (question) VALUES (?)", (questions[1],))
+        # last_insert_rowid() works on both backends; apsw cursors have no lastrowid.
+        new_question_id = setup_database.cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        val = [new_question_id] + answers[0]
         value = tuple(val)
         setup_database.cursor.execute(f"INSERT INTO {table_name} (question_id, answer_a, answer_b, answer_c, answer_d)"
                               f"VALUES (?, ?, ?, ?, ?)", value)
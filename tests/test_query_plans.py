@@ -0,0 +1,12 @@
+from main import DatabaseCreator
+
+
+def test_hot_statements_use_indexes(setup_database: DatabaseCreator, hot_plans: dict) -> None:
+    """
+    Test if the hot statements keep their index-backed query plans.
+    """
+    for name, (sql, params, expected_fragment) in hot_plans.items():
+        setup_database.cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+        plan = " | ".join(row[3] for row in setup_database.cursor.fetchall())
+        assert expected_fragment in plan, f"Statement {name} lost its index: {plan}"
+        assert "SCAN" not in plan, f"Statement {name} degraded to a full scan: {plan}"